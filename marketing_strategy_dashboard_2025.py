@@ -1,11 +1,28 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
+import gzip
+import hashlib
 import io
+import json
+import os
+import re
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# Rust-backed XLSX reader when available; openpyxl otherwise
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
 
 # Page configuration
 st.set_page_config(
@@ -15,8 +32,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def _compact_css(css):
+    """Stylesheet with comments and layout whitespace stripped, built once per process"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
 # Enhanced Custom CSS with modern, attractive styling
-st.markdown("""
+# (emitted on every run: Streamlit drops elements a rerun does not re-emit, so the
+# payload is kept small instead)
+st.markdown(_compact_css("""
     <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap');
@@ -99,7 +125,7 @@ st.markdown("""
     
     /* Enhanced metric cards with hover effects */
     div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        background: var(--metric-gradient, linear-gradient(135deg, #667eea 0%, #764ba2 100%));
         padding: 25px;
         border-radius: 20px;
         box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
@@ -145,26 +171,11 @@ st.markdown("""
         letter-spacing: 1px;
     }
     
-    /* Unique gradient for each metric column */
-    div[data-testid="column"]:nth-child(1) div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    div[data-testid="column"]:nth-child(2) div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-    }
-    
-    div[data-testid="column"]:nth-child(3) div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-    }
-    
-    div[data-testid="column"]:nth-child(4) div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);
-    }
-    
-    div[data-testid="column"]:nth-child(5) div[data-testid="metric-container"] {
-        background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-    }
+    /* Unique gradient for each metric column (first column uses the default above) */
+    div[data-testid="column"]:nth-child(2) { --metric-gradient: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+    div[data-testid="column"]:nth-child(3) { --metric-gradient: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
+    div[data-testid="column"]:nth-child(4) { --metric-gradient: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); }
+    div[data-testid="column"]:nth-child(5) { --metric-gradient: linear-gradient(135deg, #fa709a 0%, #fee140 100%); }
     
     /* Sidebar styling */
     [data-testid="stSidebar"] {
@@ -302,6 +313,8 @@ st.markdown("""
         border-radius: 10px;
         overflow: hidden;
         box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+        color: #e0e0e0 !important;
+        background-color: rgba(30, 30, 50, 0.8) !important;
     }
     
     /* Multiselect styling */
@@ -333,12 +346,6 @@ st.markdown("""
         color: #e0e0e0 !important;
     }
     
-    /* Dataframe text */
-    .dataframe {
-        color: #e0e0e0 !important;
-        background-color: rgba(30, 30, 50, 0.8) !important;
-    }
-    
     /* Info/Success/Warning text */
     .stAlert p {
         color: #1a1a2e !important;
@@ -434,55 +441,38 @@ st.markdown("""
         border: 1px solid rgba(255, 255, 255, 0.1);
     }
     
-    /* Snowfall Animation for December Tab */
-    .snowflake {
+    /* Snowfall Animation for December Tab: one fixed layer of tiled flakes that slides
+       down by one tile per cycle, so the compositor moves a single surface */
+    .snowfall {
         position: fixed;
-        top: -10px;
+        top: -400px;
+        left: 0;
+        width: 100%;
+        height: calc(100vh + 400px);
         z-index: 9999;
-        user-select: none;
-        cursor: default;
-        animation-name: snowfall;
-        animation-duration: 10s;
-        animation-timing-function: linear;
-        animation-iteration-count: infinite;
-        color: white;
-        font-size: 1.5em;
-        text-shadow: 0 0 5px rgba(255, 255, 255, 0.8);
+        pointer-events: none;
+        background-image: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='400' height='400'><g fill='white' fill-opacity='0.9' font-size='24'><text x='20' y='40'>❄</text><text x='140' y='120'>❅</text><text x='260' y='30'>❆</text><text x='360' y='190'>❄</text><text x='80' y='240'>❆</text><text x='210' y='300'>❄</text><text x='320' y='370'>❅</text><text x='30' y='360'>❅</text></g></svg>");
+        background-size: 400px 400px;
+        will-change: transform;
+        animation: snowfall 4s linear infinite;
     }
     
     @keyframes snowfall {
         0% {
-            transform: translateY(0vh) rotate(0deg);
-            opacity: 1;
+            transform: translateY(0);
         }
         100% {
-            transform: translateY(100vh) rotate(360deg);
-            opacity: 0.8;
+            transform: translateY(400px);
         }
     }
     
-    .snowflake:nth-of-type(1) { left: 5%; animation-delay: 0s; animation-duration: 8s; }
-    .snowflake:nth-of-type(2) { left: 10%; animation-delay: 1s; animation-duration: 10s; }
-    .snowflake:nth-of-type(3) { left: 15%; animation-delay: 2s; animation-duration: 9s; }
-    .snowflake:nth-of-type(4) { left: 20%; animation-delay: 0.5s; animation-duration: 11s; }
-    .snowflake:nth-of-type(5) { left: 25%; animation-delay: 1.5s; animation-duration: 8.5s; }
-    .snowflake:nth-of-type(6) { left: 30%; animation-delay: 2.5s; animation-duration: 10.5s; }
-    .snowflake:nth-of-type(7) { left: 35%; animation-delay: 0.8s; animation-duration: 9.5s; }
-    .snowflake:nth-of-type(8) { left: 40%; animation-delay: 1.8s; animation-duration: 11.5s; }
-    .snowflake:nth-of-type(9) { left: 45%; animation-delay: 0.3s; animation-duration: 10s; }
-    .snowflake:nth-of-type(10) { left: 50%; animation-delay: 2.3s; animation-duration: 9s; }
-    .snowflake:nth-of-type(11) { left: 55%; animation-delay: 1.3s; animation-duration: 8s; }
-    .snowflake:nth-of-type(12) { left: 60%; animation-delay: 0.6s; animation-duration: 11s; }
-    .snowflake:nth-of-type(13) { left: 65%; animation-delay: 2.6s; animation-duration: 10.5s; }
-    .snowflake:nth-of-type(14) { left: 70%; animation-delay: 1.6s; animation-duration: 9.5s; }
-    .snowflake:nth-of-type(15) { left: 75%; animation-delay: 0.9s; animation-duration: 8.5s; }
-    .snowflake:nth-of-type(16) { left: 80%; animation-delay: 2.9s; animation-duration: 11.5s; }
-    .snowflake:nth-of-type(17) { left: 85%; animation-delay: 1.1s; animation-duration: 10s; }
-    .snowflake:nth-of-type(18) { left: 90%; animation-delay: 2.1s; animation-duration: 9s; }
-    .snowflake:nth-of-type(19) { left: 95%; animation-delay: 0.4s; animation-duration: 10.5s; }
-    .snowflake:nth-of-type(20) { left: 7%; animation-delay: 2.4s; animation-duration: 8.5s; }
+    @media (prefers-reduced-motion: reduce) {
+        .snowfall {
+            animation: none;
+        }
+    }
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # Initialize session state
 if 'data_loaded' not in st.session_state:
@@ -518,61 +508,199 @@ with st.sidebar:
     if uploaded_file:
         st.success("✅ File uploaded successfully!")
 
+# Preprocessed uploads are persisted as Parquet next to this script, keyed by content hash.
+# Only the most recently written CACHE_MAX_FILES entries are kept; older ones (including those
+# orphaned by edits to this script) are pruned on each write, and the directory can be deleted
+# at any time
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+CACHE_MAX_FILES = 32
+
+def _parquet_cache_path(data_key):
+    """Return the Parquet cache path for an upload's content digest"""
+    digest = hashlib.blake2b(data_key.encode())
+    # Mix in this script's source so edits to the preprocessing invalidate old entries
+    with open(__file__, 'rb') as source:
+        digest.update(source.read())
+    return os.path.join(CACHE_DIR, f"{digest.hexdigest()}.parquet")
+
+def _read_parquet_cache(path):
+    """Return the cached (frame, preprocessing_info) for path, or None when absent or unreadable"""
+    if not os.path.exists(path):
+        return None
+    try:
+        table = pq.read_table(path)
+        preprocessing_info = json.loads(table.schema.metadata[b'preprocessing_info'])
+        return table.to_pandas(), preprocessing_info
+    except (OSError, ValueError, KeyError, TypeError, pa.ArrowException):
+        # Best-effort like the write: a corrupt or stale entry just means parsing the upload again
+        return None
+
+def _prune_parquet_cache():
+    """Delete all but the CACHE_MAX_FILES most recently written cache entries"""
+    entries = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith('.parquet')]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[CACHE_MAX_FILES:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def _write_parquet_cache(path, df, preprocessing_info):
+    """Persist the preprocessed frame, with its summary stored in the schema metadata"""
+    # Write then rename so concurrent sessions never read a partial file. Sessions are threads
+    # of one process, so each write gets its own mkstemp name rather than a per-pid one
+    tmp_path = None
+    try:
+        table = pa.Table.from_pandas(df)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'preprocessing_info'] = json.dumps(preprocessing_info).encode('utf-8')
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        os.close(fd)
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+        _prune_parquet_cache()
+    except (OSError, ValueError, TypeError, pa.ArrowException):
+        # The disk cache is best-effort; the in-memory result is still returned
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+MONTH_ORDER = [
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+]
+
+# Rows dated on or after this are dropped
+DATE_CUTOFF = pd.Timestamp('2026-01-01')
+
+# Arrow types for the known CSV columns so the reader parses dates and numbers itself
+CSV_COLUMN_TYPES = {
+    'Release_Date': pa.timestamp('ns'),
+    'Viewing_Month': pa.timestamp('ns'),
+    'Viewer_Rate': pa.float64(),
+    'Number_of_Views': pa.int64(),
+}
+
+def _year_and_month(dates):
+    """Calendar year and month number of a datetime column (no NaT) from one month-resolution cast"""
+    # Cheaper than the two field extractions behind .dt.year and .dt.month
+    year, month = np.divmod(dates.to_numpy().astype('datetime64[M]').astype(np.int64), 12)
+    return (year + 1970).astype(np.int32), (month + 1).astype(np.int32)
+
+def _read_csv(data):
+    """Parse CSV bytes with Arrow's multi-threaded reader"""
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+    try:
+        convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+        table = pacsv.read_csv(pa.py_buffer(data), read_options=read_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        # Malformed values: let Arrow infer the types and the coercion passes clean up
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+        table = pacsv.read_csv(pa.py_buffer(data), read_options=read_options, convert_options=convert_options)
+    return table.to_pandas()
+
 # Data loading and preprocessing function
-@st.cache_data
-def load_and_preprocess_data(file):
+# Keyed on the upload's digest; the leading underscore stops Streamlit hashing the file itself.
+# cache_resource hands every rerun the same frame instead of unpickling a fresh copy, so the
+# frame and the aggregates below are treated as read-only by the rest of the script
+@st.cache_resource
+def load_and_preprocess_data(data_key, _file):
     """Load and preprocess the dataset"""
     try:
+        # Reuse a previous session's preprocessing of the same upload
+        cache_path = _parquet_cache_path(data_key)
+        cached = _read_parquet_cache(cache_path)
+        if cached is not None:
+            return cached
+        
         # Read file based on extension
-        if file.name.endswith('.csv'):
-            df = pd.read_csv(file)
+        if _file.name.endswith('.csv'):
+            df = _read_csv(_file.getvalue())
         else:
-            df = pd.read_excel(file)
+            df = pd.read_excel(_file, engine=EXCEL_ENGINE)
         
         # Store original shape
         original_shape = df.shape
         
-        # Convert date columns to datetime
+        # Convert date columns to datetime; well-formed CSVs arrive typed from Arrow,
+        # and coercing those again would only copy the column
         date_columns = ['Release_Date', 'Viewing_Month']
         for col in date_columns:
-            if col in df.columns:
+            if col in df.columns and not pd.api.types.is_datetime64_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], errors='coerce')
+            # Offset-bearing dates come back tz-aware; normalize them to naive UTC (what Arrow's
+            # CSV reader already yields for them) so the cutoff compare and month casts below work
+            if col in df.columns and isinstance(df[col].dtype, pd.DatetimeTZDtype):
+                df[col] = df[col].dt.tz_convert(None)
         
-        # Remove rows with dates in 2026 or later
-        if 'Release_Date' in df.columns:
-            df = df[df['Release_Date'].dt.year < 2026]
-        if 'Viewing_Month' in df.columns:
-            df = df[df['Viewing_Month'].dt.year < 2026]
+        # Convert numeric columns (skipped likewise when already typed)
+        numeric_cols = ['Viewer_Rate', 'Number_of_Views']
+        for col in numeric_cols:
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
         
-        # Remove duplicates
-        df = df.drop_duplicates()
+        # Build every row filter into one mask and materialize the frame once:
+        # dates before 2026 (unparseable dates fail the comparison), film name
+        # and critical numeric values present
+        keep = df['Film_Name'].notna().to_numpy(copy=True)
+        cutoff = DATE_CUTOFF.to_datetime64()
+        for col in date_columns:
+            if col in df.columns:
+                # Raw datetime64 compare; NaT is never less than the cutoff (an int64 view
+                # would turn it into the smallest integer and keep it)
+                keep &= df[col].to_numpy() < cutoff
+        for col in numeric_cols:
+            keep &= df[col].notna().to_numpy()
+        rows = np.flatnonzero(keep)
         
-        # Handle missing values
-        df = df.dropna(subset=['Film_Name'])
+        # Drop duplicates among the surviving rows (a film is counted once per viewing month),
+        # testing only the key columns so the full frame is taken a single time. Without a
+        # Viewing_Month column there is no such key, so whole rows are compared
+        if 'Viewing_Month' in df.columns:
+            duplicate = df[['Film_Name', 'Viewing_Month']].iloc[rows].duplicated(keep='first').to_numpy()
+        else:
+            duplicate = df.iloc[rows].duplicated(keep='first').to_numpy()
+        df = df.iloc[rows[~duplicate]]
         
-        # Convert numeric columns
-        numeric_cols = ['Viewer_Rate', 'Number_of_Views']
-        for col in numeric_cols:
+        # Narrow dtypes halve the bytes every aggregate streams through
+        df['Viewer_Rate'] = df['Viewer_Rate'].astype(np.float32)
+        df['Number_of_Views'] = pd.to_numeric(df['Number_of_Views'], downcast='unsigned')
+        
+        # Low-cardinality labels as categoricals so groupby/isin work on integer codes
+        for col in ('Category', 'Language'):
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                df[col] = df[col].astype('category')
         
-        # Remove rows with missing critical values
-        df = df.dropna(subset=numeric_cols)
+        # Remaining object columns as Arrow-backed strings, so the exporters read contiguous
+        # UTF-8 buffers instead of boxing a Python str per cell. Only true object dtype:
+        # select_dtypes('object') also matches pandas 3's default str columns, and recasting
+        # those would switch their missing values from NaN to pd.NA
+        text_columns = [col for col in df.columns if df[col].dtype == object]
+        if len(text_columns):
+            df = df.astype({col: pd.StringDtype('pyarrow') for col in text_columns})
         
-        # Create additional features
+        # Create additional features (month names by lookup into calendar-ordered categories)
         if 'Release_Date' in df.columns:
-            df['Release_Year'] = df['Release_Date'].dt.year
-            df['Release_Month'] = df['Release_Date'].dt.month
-            df['Release_Month_Name'] = df['Release_Date'].dt.strftime('%B')
+            year, month = _year_and_month(df['Release_Date'])
+            df['Release_Year'] = year
+            df['Release_Month'] = month
+            df['Release_Month_Name'] = pd.Categorical.from_codes(month - 1, categories=MONTH_ORDER, ordered=True)
         
         if 'Viewing_Month' in df.columns:
-            df['Viewing_Year'] = df['Viewing_Month'].dt.year
-            df['Viewing_Month_Num'] = df['Viewing_Month'].dt.month
-            df['Viewing_Month_Name'] = df['Viewing_Month'].dt.strftime('%B')
+            year, month = _year_and_month(df['Viewing_Month'])
+            df['Viewing_Year'] = year
+            df['Viewing_Month_Num'] = month
+            df['Viewing_Month_Name'] = pd.Categorical.from_codes(month - 1, categories=MONTH_ORDER, ordered=True)
         
         # Calculate engagement score
         if 'Viewer_Rate' in df.columns and 'Number_of_Views' in df.columns:
-            df['Engagement_Score'] = df['Viewer_Rate'] * np.log1p(df['Number_of_Views'])
+            # log1p allocates the output once; the multiply then runs in place on it
+            engagement = np.log1p(df['Number_of_Views'].to_numpy(dtype=np.float32))
+            np.multiply(engagement, df['Viewer_Rate'].to_numpy(), out=engagement)
+            df['Engagement_Score'] = engagement
         
         preprocessing_info = {
             'original_rows': original_shape[0],
@@ -582,19 +710,506 @@ def load_and_preprocess_data(file):
             'removed_rows': original_shape[0] - df.shape[0]
         }
         
+        _write_parquet_cache(cache_path, df, preprocessing_info)
+        
         return df, preprocessing_info
     
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return None, None
 
+# Aggregates shared by several tabs, computed once per dataset rather than per rerun
+@st.cache_resource(show_spinner=False)
+def compute_aggregates(data_key, _df):
+    """Precompute tab aggregates; data_key identifies the upload so _df is not hashed"""
+    df = _df
+    aggregates = {
+        'category_counts': df['Category'].value_counts(),
+        'language_counts': df['Language'].value_counts(),
+        'category_rating': df.groupby('Category', observed=True)['Viewer_Rate'].mean(),
+        # Tab 4 filter options in order of first appearance, scanned once instead of per rerun
+        'category_options': df['Category'].unique().tolist(),
+        'language_options': df['Language'].unique().tolist(),
+        'december_df': df
+    }
+    
+    if 'Viewing_Month_Name' in df.columns:
+        # Twelve-bin weighted bincount over the month codes, already in calendar order;
+        # months without any viewing stay NaN so the line shows a gap rather than a zero
+        month_codes = df['Viewing_Month_Name'].cat.codes.to_numpy().astype(np.intp)
+        month_views = np.bincount(month_codes, weights=df['Number_of_Views'].to_numpy(), minlength=len(MONTH_ORDER))
+        month_present = np.bincount(month_codes, minlength=len(MONTH_ORDER)) > 0
+        monthly_views = pd.Series(month_views.astype(np.int64), index=MONTH_ORDER)
+        aggregates['monthly_views'] = monthly_views if month_present.all() else monthly_views.where(month_present)
+        # December rows by an integer compare on the same codes, then a positional take
+        december_code = MONTH_ORDER.index('December')
+        aggregates['december_df'] = df.iloc[np.flatnonzero(month_codes == december_code)]
+    
+    if 'Engagement_Score' in df.columns:
+        aggregates['category_engagement'] = df.groupby('Category', observed=True)['Engagement_Score'].mean()
+    
+    # December summaries shared by the strategy and recommendations tabs: the headline
+    # reductions in one agg, and one groupby per breakdown
+    december_df = aggregates['december_df']
+    december_reductions = {'Number_of_Views': 'sum', 'Viewer_Rate': 'mean'}
+    if 'Engagement_Score' in december_df.columns:
+        december_reductions['Engagement_Score'] = 'mean'
+    aggregates['december_totals'] = december_df.agg(december_reductions)
+    aggregates['december_category'] = december_df.groupby('Category', observed=True).agg({
+        'Number_of_Views': 'sum',
+        'Viewer_Rate': 'mean'
+    })
+    aggregates['december_language_views'] = december_df.groupby('Language', observed=True)['Number_of_Views'].sum()
+    
+    # Headline totals and top-10 tables, which otherwise rescan every row on each rerun
+    aggregates['total_views'] = df['Number_of_Views'].sum()
+    aggregates['mean_rating'] = df['Viewer_Rate'].mean()
+    top_columns = ['Film_Name', 'Category', 'Viewer_Rate', 'Number_of_Views']
+    aggregates['top_views'] = top_k(df, 'Number_of_Views')[top_columns]
+    aggregates['top_rated'] = top_k(df, 'Viewer_Rate')[top_columns]
+    if 'Engagement_Score' in december_df.columns:
+        aggregates['december_top_engagement'] = top_k(december_df, 'Engagement_Score')[
+            ['Film_Name', 'Category', 'Language', 'Viewer_Rate', 'Number_of_Views', 'Engagement_Score']
+        ]
+    
+    # Performance quadrants against the median film: two bits per film (high views, high rating)
+    # index straight into the labels, and the same codes give the per-quadrant counts
+    views = df['Number_of_Views'].to_numpy()
+    ratings = df['Viewer_Rate'].to_numpy()
+    median_views = np.median(views)
+    median_rating = np.median(ratings)
+    codes = ((views >= median_views).astype(np.int8) << 1) | (ratings >= median_rating).astype(np.int8)
+    aggregates['median_views'] = median_views
+    aggregates['median_rating'] = median_rating
+    aggregates['quadrant'] = pd.Categorical.from_codes(codes, categories=QUADRANT_LABELS)
+    # The frame with its Quadrant column, for the quadrant chart and the exports; built here
+    # once per upload since the loaded frame is shared and never gets the column itself
+    aggregates['df_with_quadrant'] = df.assign(Quadrant=aggregates['quadrant'])
+    aggregates['quadrant_counts'] = pd.Series(np.bincount(codes, minlength=len(QUADRANT_LABELS)), index=QUADRANT_LABELS)
+    
+    # Plot inputs that scan every row, prepared once: the scatter's row sample and, for uploads
+    # too large to box client-side, the per-category rating boxes
+    aggregates['plot_sample'] = _plot_sample(df)
+    if len(df) > PLOT_SAMPLE_ROWS:
+        aggregates['rating_boxes'] = _box_stats(df, 'Category', 'Viewer_Rate')
+    
+    return aggregates
+
+# Columns the Tab 3 correlation heatmap compares
+CORRELATION_COLUMNS = ['Number_of_Views', 'Viewer_Rate', 'Engagement_Score']
+
+@st.cache_data(show_spinner=False)
+def compute_correlation(data_key, _df):
+    """Correlation matrix of the film metrics that vary across the upload"""
+    # The derived year/month numbers are calendar bookkeeping, not metrics worth correlating
+    numeric_df = _df[[col for col in CORRELATION_COLUMNS if col in _df.columns]]
+    # Constant columns have no defined correlation and only inflate the matrix (all-NaN
+    # columns fail max > min too, and go with them)
+    numeric_df = numeric_df.loc[:, (numeric_df.max() > numeric_df.min()).to_numpy()]
+    # DataFrame.corr drops a missing value only from the pairs it is in; np.corrcoef would
+    # spread one NaN Engagement_Score across that metric's whole row and column
+    return numeric_df.corr()
+
+# Tab 4 results are keyed by the multiselect state, so every combination any session clicks
+# through would otherwise stay cached for the life of the server; keep the most recent ones
+SELECTION_CACHE_ENTRIES = 64
+
+@st.cache_data(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def compute_selection(data_key, categories, languages, _df):
+    """Film count, cross-tab and performance tables for one Tab 4 selection"""
+    # The selections (as sorted tuples) and the upload digest key the cache; the frame is not hashed.
+    # Match the selections as integer category codes rather than hashing strings
+    category_mask = np.isin(
+        _df['Category'].cat.codes.to_numpy(),
+        _df['Category'].cat.categories.get_indexer(list(categories))
+    )
+    language_mask = np.isin(
+        _df['Language'].cat.codes.to_numpy(),
+        _df['Language'].cat.categories.get_indexer(list(languages))
+    )
+    # Take only the columns the tables read
+    filtered = _df[['Category', 'Language', 'Number_of_Views', 'Viewer_Rate']].iloc[
+        np.flatnonzero(category_mask & language_mask)
+    ]
+    return {
+        'film_count': len(filtered),
+        'cross_tab': _crosstab_views(filtered),
+        'category_performance': _group_performance(filtered, 'Category'),
+        'language_performance': _group_performance(filtered, 'Language')
+    }
+
+# Point-per-row charts are capped at this many films to keep the browser payload bounded
+PLOT_SAMPLE_ROWS = 5000
+
+def _plot_sample(df, n=PLOT_SAMPLE_ROWS):
+    """Return df, or a reproducible sample of n rows when it is larger"""
+    return df if len(df) <= n else df.sample(n, random_state=0)
+
+def _box_stats(df, by, col):
+    """Per-group quartiles and whisker ends, computed the way plotly does from raw points"""
+    values = df[col]
+    stats = values.groupby(df[by], observed=True).quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ['q1', 'median', 'q3']
+    iqr = stats['q3'] - stats['q1']
+    # Whiskers stop at the most extreme points within 1.5 IQR of the box
+    codes = df[by].cat.codes.to_numpy()
+    low = (stats['q1'] - 1.5 * iqr).reindex(df[by].cat.categories).to_numpy()[codes]
+    high = (stats['q3'] + 1.5 * iqr).reindex(df[by].cat.categories).to_numpy()[codes]
+    stats['lowerfence'] = values.where(values >= low).groupby(df[by], observed=True).min()
+    stats['upperfence'] = values.where(values <= high).groupby(df[by], observed=True).max()
+    return stats
+
+def top_k(df, col, k=10):
+    """Rows with the k largest values of col, ordered like DataFrame.nlargest"""
+    values = df[col].to_numpy()
+    # nlargest skips missing values; np.partition would sort NaN into the top slots
+    valid = np.flatnonzero(df[col].notna().to_numpy())
+    if len(valid) > k:
+        # O(n) partition finds the k-th largest value; only rows reaching it are sorted
+        threshold = np.partition(values[valid], len(valid) - k)[len(valid) - k]
+        candidates = valid[values[valid] >= threshold]
+    else:
+        candidates = valid
+    # Stable descending sort keeps ties in row order, like nlargest(keep='first')
+    order = np.argsort(-values[candidates].astype(np.float64), kind='stable')[:k]
+    return df.iloc[candidates[order]]
+
+def _bar(series, title, value_label, label_label, colorscale, orientation='v'):
+    """Bar chart of a labelled Series built straight from its arrays, bypassing Plotly Express"""
+    values = series.to_numpy()
+    labels = series.index.to_numpy()
+    x, y = (values, labels) if orientation == 'h' else (labels, values)
+    fig = go.Figure(go.Bar(
+        x=x,
+        y=y,
+        orientation=orientation,
+        marker=dict(color=values, colorscale=colorscale, showscale=True)
+    ))
+    x_title, y_title = (value_label, label_label) if orientation == 'h' else (label_label, value_label)
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig
+
+# Finished figures per upload: reruns skip Plotly Express construction, which costs far more
+# than st.plotly_chart's own serialization. _build is not hashed; name tells the charts of
+# one upload apart. Figures are shared, so they are never modified after being built
+@st.cache_resource(show_spinner=False)
+def cached_figure(data_key, name, _build):
+    """Build a chart once per upload and name"""
+    return _build()
+
+# Charts that follow the Tab 4 filters get their own cache, bounded like compute_selection,
+# so clicking through combinations does not pin a figure per selection in server memory
+@st.cache_resource(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def cached_selection_figure(data_key, name, selection_key, _build):
+    """Build a chart once per upload, name and Tab 4 selection"""
+    return _build()
+
+def _crosstab_views(frame):
+    """Sum Number_of_Views per (Category, Language) pair using the categorical codes"""
+    categories = frame['Category'].cat.categories
+    languages = frame['Language'].cat.categories
+    cat_codes = frame['Category'].cat.codes.to_numpy().astype(np.intp)
+    lang_codes = frame['Language'].cat.codes.to_numpy().astype(np.intp)
+    valid = (cat_codes >= 0) & (lang_codes >= 0)
+    
+    # One weighted bincount over the flattened pair index replaces the hash groupby
+    cells = cat_codes[valid] * len(languages) + lang_codes[valid]
+    size = len(categories) * len(languages)
+    views = np.bincount(cells, weights=frame['Number_of_Views'].to_numpy()[valid], minlength=size)
+    present = np.bincount(cells, minlength=size) > 0
+    views = np.where(present, views, np.nan).reshape(len(categories), len(languages))
+    present = present.reshape(len(categories), len(languages))
+    
+    # Match pd.crosstab: empty pairs are NaN and unobserved rows/columns are dropped
+    cross_tab = pd.DataFrame(
+        views,
+        index=pd.Index(categories, name='Category'),
+        columns=pd.Index(languages, name='Language')
+    )
+    return cross_tab.loc[present.any(axis=1), present.any(axis=0)]
+
+def _group_performance(frame, by):
+    """Total views, mean rating and film count per observed value of a categorical column"""
+    # Weighted bincounts over the integer codes stand in for a hash groupby with three aggs
+    labels = frame[by].cat.categories
+    codes = frame[by].cat.codes.to_numpy().astype(np.intp)
+    valid = codes >= 0
+    codes = codes[valid]
+    counts = np.bincount(codes, minlength=len(labels))
+    views = np.bincount(codes, weights=frame['Number_of_Views'].to_numpy()[valid], minlength=len(labels))
+    ratings = np.bincount(codes, weights=frame['Viewer_Rate'].to_numpy()[valid], minlength=len(labels))
+    present = counts > 0
+    
+    return pd.DataFrame(
+        {
+            'Total Views': views[present].astype(np.int64),
+            'Avg Rating': (ratings[present] / counts[present]).round(2),
+            'Film Count': counts[present]
+        },
+        index=pd.CategoricalIndex(labels[present], categories=labels, name=by)
+    )
+
+def _bar_column(values, fmt):
+    """Table column drawn as bars scaled to the largest of values"""
+    max_value = float(values.max()) if len(values) else 1.0
+    return st.column_config.ProgressColumn(format=fmt, min_value=0, max_value=max_value)
+
+# December marketing calendar: (week, focus, content type, budget); {category} is filled per dataset
+CALENDAR_WEEKS = (
+    ('Week 1 (Dec 1-7)', 'Launch {category} campaign', 'New releases announcement', '30%'),
+    ('Week 2 (Dec 8-14)', 'Mid-month engagement push', 'User-generated content campaign', '25%'),
+    ('Week 3 (Dec 15-21)', 'Holiday season special promotions', 'Gift subscription promotions', '25%'),
+    ('Week 4 (Dec 22-31)', 'Year-end celebration content', 'New Year preview teasers', '20%')
+)
+
+# Quadrant labels in code order: bit 1 is high views, bit 0 is high rating
+QUADRANT_LABELS = ['Low Performance', 'Hidden Gems', 'High Views, Low Rating', 'Star Performers']
+QUADRANT_COLORS = {
+    'Star Performers': 'green',
+    'High Views, Low Rating': 'orange',
+    'Hidden Gems': 'blue',
+    'Low Performance': 'red'
+}
+
+# Export serializers, passed to the download buttons as callables so they only run on click;
+# cached per upload (data_key, with _df unhashed) so repeat downloads are a lookup that skips
+# hashing the frame, which Streamlit would only sample above 50k rows anyway
+CSV_CHUNK_ROWS = 50000
+
+def _csv_timestamp_type(series):
+    """Narrowest Arrow type that still prints every value of a datetime column in full"""
+    # Midnight-only columns print as plain dates and whole-second ones without a fraction,
+    # matching the layout pandas used; decided on the whole column so every chunk agrees
+    values = series.dropna()
+    if (values == values.dt.normalize()).all():
+        return pa.date32()
+    if (values == values.dt.floor('s')).all():
+        return pa.timestamp('s')
+    return None
+
+@st.cache_data(show_spinner=False)
+def to_csv_gz_bytes(data_key, _df):
+    """Serialize the frame as gzip-compressed UTF-8 CSV"""
+    # Arrow's C++ writer encodes straight to UTF-8 bytes; converting and writing in row
+    # chunks keeps only one chunk's Arrow copy of the frame alive at a time. The text is
+    # gzipped on the way into the buffer, at level 1 since transfer size matters far
+    # more than the last few percent of ratio
+    schema = pa.Schema.from_pandas(_df, preserve_index=False)
+    target = schema
+    for i, field in enumerate(schema):
+        if pa.types.is_timestamp(field.type):
+            narrowed = _csv_timestamp_type(_df[field.name])
+            if narrowed is not None:
+                target = target.set(i, field.with_type(narrowed))
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=1, mtime=0) as stream:
+        with pacsv.CSVWriter(stream, target) as writer:
+            for start in range(0, len(_df), CSV_CHUNK_ROWS):
+                chunk = _df.iloc[start:start + CSV_CHUNK_ROWS]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False).cast(target))
+    return buffer.getvalue()
+
+# Package parts of the export workbook; only the worksheets and the parts listing them vary
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{sheets}'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+XLSX_CONTENT_TYPE_SHEET = (
+    '<Override PartName="/xl/worksheets/sheet{number}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_SHEET = '<sheet name="{name}" sheetId="{number}" r:id="rId{number}"/>'
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}'
+    '<Relationship Id="rIdStyles" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK_REL_SHEET = (
+    '<Relationship Id="rId{number}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{number}.xml"/>'
+)
+XLSX_PARTS = {
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    # Style 1 is the date-time format pandas gives datetime cells
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy\\-mm\\-dd\\ hh:mm:ss"/></numFmts>'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ),
+}
+XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+XLSX_EPOCH = pd.Timestamp('1899-12-30')
+XLSX_ROW_BATCH = 10000
+# Rows per worksheet; far below Excel's hard 1,048,576 limit so each sheet stays quick to open
+XLSX_SHEET_ROWS = 250000
+# Control characters XML 1.0 cannot carry at all
+_XML_ILLEGAL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _xlsx_column_letters(n):
+    """Spreadsheet column names for the first n columns (A, B, ..., Z, AA, ...)"""
+    letters = []
+    for i in range(n):
+        name = ''
+        i += 1
+        while i:
+            i, rem = divmod(i - 1, 26)
+            name = chr(65 + rem) + name
+        letters.append(name)
+    return letters
+
+def _xml_text(series):
+    """Escape a column's values for use as XML character data"""
+    return (
+        series.astype(str)
+        .str.replace(_XML_ILLEGAL.pattern, '', regex=True)
+        .str.replace('&', '&amp;', regex=False)
+        .str.replace('<', '&lt;', regex=False)
+        .str.replace('>', '&gt;', regex=False)
+    )
+
+def _xlsx_column_cells(series, letter, rows):
+    """Cell XML for a whole column at once, '' where the value is missing"""
+    # Formatting a column in one vectorized pass beats converting every cell on its own
+    refs = f'<c r="{letter}' + rows
+    if pd.api.types.is_bool_dtype(series):
+        cells = refs + '" t="b"><v>' + series.map({True: '1', False: '0'}) + '</v></c>'
+    elif pd.api.types.is_datetime64_dtype(series):
+        # Excel stores datetimes as fractional days since its epoch
+        serials = (series - XLSX_EPOCH) / pd.Timedelta(days=1)
+        cells = refs + '" s="1"><v>' + serials.astype(str) + '</v></c>'
+    elif pd.api.types.is_numeric_dtype(series):
+        cells = refs + '"><v>' + series.astype(str) + '</v></c>'
+        # <v>inf</v> is not a valid number, so infinities are left blank like NaN
+        return cells.where(np.isfinite(series.to_numpy(np.float64, na_value=np.nan)), '')
+    else:
+        cells = refs + '" t="inlineStr"><is><t xml:space="preserve">' + _xml_text(series) + '</t></is></c>'
+    return cells.where(series.notna(), '')
+
+def write_xlsx(df, out, sheet_name='Processed Data'):
+    """Write the frame as an XLSX workbook to a path or binary file object"""
+    # A few unstyled sheets of plain values need none of an Excel library's object model, so
+    # the fixed parts are templates and the worksheet XML is streamed into the zip in batches.
+    # Frames longer than XLSX_SHEET_ROWS continue on numbered sheets, each with the header
+    letters = _xlsx_column_letters(len(df.columns))
+    header = ''.join(
+        f'<c r="{letter}1" t="inlineStr"><is><t xml:space="preserve">{escape(_XML_ILLEGAL.sub("", str(col)))}</t></is></c>'
+        for letter, col in zip(letters, df.columns)
+    )
+    starts = range(0, max(len(df), 1), XLSX_SHEET_ROWS)
+    if len(starts) == 1:
+        names = [sheet_name]
+    else:
+        names = [f'{sheet_name} {number}' for number in range(1, len(starts) + 1)]
+    numbers = range(1, len(names) + 1)
+
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive, ThreadPoolExecutor(max_workers=1) as pool:
+        archive.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES.format(
+            sheets=''.join(XLSX_CONTENT_TYPE_SHEET.format(number=number) for number in numbers)
+        ))
+        archive.writestr('xl/workbook.xml', XLSX_WORKBOOK.format(sheets=''.join(
+            XLSX_WORKBOOK_SHEET.format(name=escape(name, {'"': '&quot;'}), number=number)
+            for name, number in zip(names, numbers)
+        )))
+        archive.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS.format(
+            sheets=''.join(XLSX_WORKBOOK_REL_SHEET.format(number=number) for number in numbers)
+        ))
+        for name, part in XLSX_PARTS.items():
+            archive.writestr(name, part)
+
+        for number, first in zip(numbers, starts):
+            part = df.iloc[first:first + XLSX_SHEET_ROWS]
+            # Deflating a batch releases the GIL, so a worker compresses each batch while the
+            # next one is formatted; waiting on it before queueing the next bounds memory
+            with archive.open(f'xl/worksheets/sheet{number}.xml', 'w') as sheet:
+                pending = pool.submit(sheet.write, f'{XLSX_SHEET_HEAD}<row r="1">{header}</row>'.encode('utf-8'))
+                for start in range(0, len(part), XLSX_ROW_BATCH):
+                    batch = part.iloc[start:start + XLSX_ROW_BATCH]
+                    rows = pd.Series(np.arange(start + 2, start + 2 + len(batch)), index=batch.index).astype(str)
+                    xml = '<row r="' + rows + '">'
+                    for letter, col in zip(letters, batch.columns):
+                        xml = xml + _xlsx_column_cells(batch[col], letter, rows)
+                    data = ''.join(xml + '</row>').encode('utf-8')
+                    pending.result()
+                    pending = pool.submit(sheet.write, data)
+                pending.result()
+                sheet.write(XLSX_SHEET_TAIL.encode('utf-8'))
+
+@st.cache_data(show_spinner=False)
+def to_xlsx_bytes(data_key, _df):
+    """Serialize the frame as an XLSX workbook"""
+    # Built in an anonymous temp file rather than a BytesIO, so the workbook is not held in
+    # a growing in-memory buffer on top of the bytes handed to the download button
+    with tempfile.TemporaryFile() as workbook:
+        write_xlsx(_df, workbook)
+        workbook.seek(0)
+        return workbook.read()
+
+@st.cache_data(show_spinner=False)
+def to_parquet_bytes(data_key, _df):
+    """Serialize the frame as a zstd-compressed Parquet file"""
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(_df, preserve_index=False), buffer, compression='zstd')
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False)
+def to_feather_bytes(data_key, _df):
+    """Serialize the frame as a zstd-compressed Feather (Arrow IPC) file"""
+    buffer = io.BytesIO()
+    feather.write_feather(pa.Table.from_pandas(_df, preserve_index=False), buffer, compression='zstd')
+    return buffer.getvalue()
+
 # Main application logic
 if uploaded_file is not None:
+    # Plotly is only needed once there is data to chart, so the landing page starts
+    # without paying for its import; _bar and the figure builders resolve these globals
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    # Content digest of the upload, keying the loader and the per-dataset caches below.
+    # Hashed once per uploaded file (each upload gets a fresh file_id), not on every rerun
+    if st.session_state.get('upload_file_id') != uploaded_file.file_id:
+        st.session_state.upload_digest = hashlib.blake2b(uploaded_file.getvalue()).hexdigest()
+        st.session_state.upload_file_id = uploaded_file.file_id
+    data_key = st.session_state.upload_digest
     with st.spinner("🔄 Loading and preprocessing data..."):
-        df, prep_info = load_and_preprocess_data(uploaded_file)
+        df, prep_info = load_and_preprocess_data(data_key, uploaded_file)
     
     if df is not None:
         st.session_state.data_loaded = True
+        aggregates = compute_aggregates(data_key, df)
         
         # Show preprocessing information
         with st.expander("ℹ️ Data Preprocessing Summary", expanded=False):
@@ -660,13 +1275,14 @@ if uploaded_file is not None:
             with col1:
                 st.metric("Total Films", len(df))
             with col2:
-                st.metric("Total Views", f"{df['Number_of_Views'].sum():,.0f}")
+                st.metric("Total Views", f"{aggregates['total_views']:,.0f}")
             with col3:
-                st.metric("Avg Rating", f"{df['Viewer_Rate'].mean():.2f}/5")
+                st.metric("Avg Rating", f"{aggregates['mean_rating']:.2f}/5")
+            # Distinct counts read off the cached histograms rather than rescanning the columns
             with col4:
-                st.metric("Categories", df['Category'].nunique())
+                st.metric("Categories", int((aggregates['category_counts'] > 0).sum()))
             with col5:
-                st.metric("Languages", df['Language'].nunique())
+                st.metric("Languages", int((aggregates['language_counts'] > 0).sum()))
             
             st.markdown("---")
             
@@ -675,125 +1291,98 @@ if uploaded_file is not None:
             
             with col1:
                 # Category Distribution
-                category_counts = df['Category'].value_counts()
-                fig_category = px.pie(
-                    values=category_counts.values,
-                    names=category_counts.index,
-                    title="Distribution by Category",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig_category.update_traces(textposition='inside', textinfo='percent+label')
-                fig_category.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_category, use_container_width=True)
+                category_counts = aggregates['category_counts']
+                def build_category_pie():
+                    fig_category = px.pie(
+                        values=category_counts.values,
+                        names=category_counts.index,
+                        title="Distribution by Category",
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
+                    fig_category.update_traces(textposition='inside', textinfo='percent+label')
+                    fig_category.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_category
+                st.plotly_chart(cached_figure(data_key, 'category_pie', build_category_pie), use_container_width=True)
             
             with col2:
                 # Language Distribution
-                language_counts = df['Language'].value_counts().head(10)
-                fig_language = px.bar(
-                    x=language_counts.values,
-                    y=language_counts.index,
-                    orientation='h',
-                    title="Top 10 Languages",
-                    labels={'x': 'Number of Films', 'y': 'Language'},
-                    color=language_counts.values,
-                    color_continuous_scale='viridis'
-                )
-                fig_language.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_language, use_container_width=True)
+                language_counts = aggregates['language_counts'].head(10)
+                def build_language_bar():
+                    fig_language = _bar(
+                        language_counts, "Top 10 Languages", 'Number of Films', 'Language', 'viridis', orientation='h'
+                    )
+                    fig_language.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_language
+                st.plotly_chart(cached_figure(data_key, 'language_bar', build_language_bar), use_container_width=True)
             
             # Views and Ratings over time
             col1, col2 = st.columns(2)
             
             with col1:
                 if 'Viewing_Month_Name' in df.columns:
-                    monthly_views = df.groupby('Viewing_Month_Name')['Number_of_Views'].sum().reindex([
-                        'January', 'February', 'March', 'April', 'May', 'June',
-                        'July', 'August', 'September', 'October', 'November', 'December'
-                    ])
-                    fig_views = px.line(
-                        x=monthly_views.index,
-                        y=monthly_views.values,
-                        title="Total Views by Month",
-                        labels={'x': 'Month', 'y': 'Total Views'},
-                        markers=True
+                    monthly_views = aggregates['monthly_views']
+                    def build_monthly_views_line():
+                        fig_views = px.line(
+                            x=monthly_views.index,
+                            y=monthly_views.values,
+                            title="Total Views by Month",
+                            labels={'x': 'Month', 'y': 'Total Views'},
+                            markers=True
+                        )
+                        fig_views.update_traces(line_color='#E50914', line_width=3, marker=dict(size=10))
+                        fig_views.update_layout(
+                            title_font_size=20,
+                            title_font_color='#667eea',
+                            title_font_family='Poppins'
+                        )
+                        return fig_views
+                    st.plotly_chart(cached_figure(data_key, 'monthly_views_line', build_monthly_views_line), use_container_width=True)
+            
+            with col2:
+                # Average rating by category
+                avg_rating = aggregates['category_rating'].sort_values(ascending=False)
+                def build_category_rating_bar():
+                    fig_rating = _bar(
+                        avg_rating, "Average Viewer Rating by Category", 'Average Rating', 'Category', 'RdYlGn', orientation='h'
                     )
-                    fig_views.update_traces(line_color='#E50914', line_width=3, marker=dict(size=10))
-                    fig_views.update_layout(
+                    fig_rating.update_layout(
                         title_font_size=20,
                         title_font_color='#667eea',
                         title_font_family='Poppins'
                     )
-                    st.plotly_chart(fig_views, use_container_width=True)
-            
-            with col2:
-                # Average rating by category
-                avg_rating = df.groupby('Category')['Viewer_Rate'].mean().sort_values(ascending=False)
-                fig_rating = px.bar(
-                    x=avg_rating.values,
-                    y=avg_rating.index,
-                    orientation='h',
-                    title="Average Viewer Rating by Category",
-                    labels={'x': 'Average Rating', 'y': 'Category'},
-                    color=avg_rating.values,
-                    color_continuous_scale='RdYlGn'
-                )
-                fig_rating.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_rating, use_container_width=True)
+                    return fig_rating
+                st.plotly_chart(cached_figure(data_key, 'category_rating_bar', build_category_rating_bar), use_container_width=True)
         
         # TAB 2: DECEMBER 2025 STRATEGY
         with tab2:
             # Add snowfall effect
-            st.markdown("""
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-                <div class="snowflake">❆</div>
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-                <div class="snowflake">❆</div>
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-                <div class="snowflake">❆</div>
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-                <div class="snowflake">❆</div>
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-                <div class="snowflake">❆</div>
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-                <div class="snowflake">❆</div>
-                <div class="snowflake">❄</div>
-                <div class="snowflake">❅</div>
-            """, unsafe_allow_html=True)
+            st.markdown('<div class="snowfall"></div>', unsafe_allow_html=True)
             
             st.header("🎯 December 2025 Marketing Strategy Insights")
             
-            # Filter December data
-            december_df = df[df['Viewing_Month_Name'] == 'December'] if 'Viewing_Month_Name' in df.columns else df
+            # December subset, precomputed with the other aggregates
+            december_df = aggregates['december_df']
             
             st.subheader("🎄 December Performance Highlights")
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("December Films", len(december_df))
+            december_totals = aggregates['december_totals']
             with col2:
-                st.metric("December Views", f"{december_df['Number_of_Views'].sum():,.0f}")
+                st.metric("December Views", f"{december_totals['Number_of_Views']:,.0f}")
             with col3:
-                st.metric("Avg December Rating", f"{december_df['Viewer_Rate'].mean():.2f}")
+                st.metric("Avg December Rating", f"{december_totals['Viewer_Rate']:.2f}")
             with col4:
-                engagement = december_df['Engagement_Score'].mean() if 'Engagement_Score' in december_df.columns else 0
+                engagement = december_totals.get('Engagement_Score', 0)
                 st.metric("Engagement Score", f"{engagement:.2f}")
             
             st.markdown("---")
@@ -802,26 +1391,25 @@ if uploaded_file is not None:
             col1, col2 = st.columns(2)
             
             with col1:
-                dec_category = december_df.groupby('Category').agg({
-                    'Number_of_Views': 'sum',
-                    'Viewer_Rate': 'mean'
-                }).sort_values('Number_of_Views', ascending=False)
+                dec_category = aggregates['december_category'].sort_values('Number_of_Views', ascending=False)
                 
-                fig_dec_cat = px.bar(
-                    dec_category,
-                    x=dec_category.index,
-                    y='Number_of_Views',
-                    title="December Views by Category",
-                    labels={'Number_of_Views': 'Total Views', 'index': 'Category'},
-                    color='Viewer_Rate',
-                    color_continuous_scale='Reds'
-                )
-                fig_dec_cat.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_dec_cat, use_container_width=True)
+                def build_december_category_bar():
+                    fig_dec_cat = px.bar(
+                        dec_category,
+                        x=dec_category.index,
+                        y='Number_of_Views',
+                        title="December Views by Category",
+                        labels={'Number_of_Views': 'Total Views', 'index': 'Category'},
+                        color='Viewer_Rate',
+                        color_continuous_scale='Reds'
+                    )
+                    fig_dec_cat.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_dec_cat
+                st.plotly_chart(cached_figure(data_key, 'december_category_bar', build_december_category_bar), use_container_width=True)
                 
                 # Top recommendation
                 top_category = dec_category.index[0]
@@ -840,48 +1428,51 @@ if uploaded_file is not None:
             
             with col2:
                 # December language performance
-                dec_language = december_df.groupby('Language')['Number_of_Views'].sum().sort_values(ascending=False).head(8)
+                dec_language = aggregates['december_language_views'].sort_values(ascending=False).head(8)
                 
-                fig_dec_lang = px.funnel(
-                    y=dec_language.index,
-                    x=dec_language.values,
-                    title="December Top Languages (Funnel View)",
-                    labels={'x': 'Views', 'y': 'Language'}
-                )
-                fig_dec_lang.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_dec_lang, use_container_width=True)
+                def build_december_language_funnel():
+                    fig_dec_lang = px.funnel(
+                        y=dec_language.index,
+                        x=dec_language.values,
+                        title="December Top Languages (Funnel View)",
+                        labels={'x': 'Views', 'y': 'Language'}
+                    )
+                    fig_dec_lang.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_dec_lang
+                st.plotly_chart(cached_figure(data_key, 'december_language_funnel', build_december_language_funnel), use_container_width=True)
             
             # High engagement films for December
             st.subheader("🌟 Recommended Films for December 2025 Campaign")
             
             if 'Engagement_Score' in december_df.columns:
-                top_films = december_df.nlargest(10, 'Engagement_Score')[
-                    ['Film_Name', 'Category', 'Language', 'Viewer_Rate', 'Number_of_Views', 'Engagement_Score']
-                ]
+                top_films = aggregates['december_top_engagement']
                 
-                fig_top = px.scatter(
-                    top_films,
-                    x='Number_of_Views',
-                    y='Viewer_Rate',
-                    size='Engagement_Score',
-                    color='Category',
-                    hover_data=['Film_Name', 'Language'],
-                    title="Top 10 Films by Engagement Score for December Marketing",
-                    labels={'Number_of_Views': 'Total Views', 'Viewer_Rate': 'Rating'}
-                )
-                fig_top.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_top, use_container_width=True)
+                def build_december_top_films_scatter():
+                    fig_top = px.scatter(
+                        top_films,
+                        x='Number_of_Views',
+                        y='Viewer_Rate',
+                        size='Engagement_Score',
+                        color='Category',
+                        hover_data=['Film_Name', 'Language'],
+                        title="Top 10 Films by Engagement Score for December Marketing",
+                        labels={'Number_of_Views': 'Total Views', 'Viewer_Rate': 'Rating'}
+                    )
+                    fig_top.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_top
+                st.plotly_chart(cached_figure(data_key, 'december_top_films_scatter', build_december_top_films_scatter), use_container_width=True)
                 
                 st.dataframe(
-                    top_films.style.background_gradient(subset=['Engagement_Score'], cmap='YlOrRd'),
+                    top_films,
+                    column_config={'Engagement_Score': _bar_column(top_films['Engagement_Score'], '%.2f')},
                     use_container_width=True
                 )
         
@@ -892,21 +1483,22 @@ if uploaded_file is not None:
             # Correlation Analysis
             st.subheader("🔗 Correlation Analysis")
             
-            numeric_df = df.select_dtypes(include=[np.number])
-            corr_matrix = numeric_df.corr()
+            corr_matrix = compute_correlation(data_key, df)
             
-            fig_corr = px.imshow(
-                corr_matrix,
-                title="Correlation Heatmap",
-                color_continuous_scale='RdBu',
-                aspect='auto'
-            )
-            fig_corr.update_layout(
-                title_font_size=20,
-                title_font_color='#667eea',
-                title_font_family='Poppins'
-            )
-            st.plotly_chart(fig_corr, use_container_width=True)
+            def build_correlation_heatmap():
+                fig_corr = px.imshow(
+                    corr_matrix,
+                    title="Correlation Heatmap",
+                    color_continuous_scale='RdBu',
+                    aspect='auto'
+                )
+                fig_corr.update_layout(
+                    title_font_size=20,
+                    title_font_color='#667eea',
+                    title_font_family='Poppins'
+                )
+                return fig_corr
+            st.plotly_chart(cached_figure(data_key, 'correlation_heatmap', build_correlation_heatmap), use_container_width=True)
             
             st.markdown("---")
             
@@ -915,60 +1507,78 @@ if uploaded_file is not None:
             
             with col1:
                 # Views vs Rating scatter
-                fig_scatter = px.scatter(
-                    df,
-                    x='Viewer_Rate',
-                    y='Number_of_Views',
-                    color='Category',
-                    size='Number_of_Views',
-                    title="Viewer Rating vs Number of Views",
-                    labels={'Viewer_Rate': 'Rating', 'Number_of_Views': 'Views'},
-                    hover_data=['Film_Name']
-                )
-                fig_scatter.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_scatter, use_container_width=True)
+                def build_rating_views_scatter():
+                    fig_scatter = px.scatter(
+                        aggregates['plot_sample'],
+                        x='Viewer_Rate',
+                        y='Number_of_Views',
+                        color='Category',
+                        size='Number_of_Views',
+                        title="Viewer Rating vs Number of Views",
+                        labels={'Viewer_Rate': 'Rating', 'Number_of_Views': 'Views'},
+                        hover_data=['Film_Name']
+                    )
+                    fig_scatter.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_scatter
+                st.plotly_chart(cached_figure(data_key, 'rating_views_scatter', build_rating_views_scatter), use_container_width=True)
             
             with col2:
                 # Box plot for ratings by category
-                fig_box = px.box(
-                    df,
-                    x='Category',
-                    y='Viewer_Rate',
-                    color='Category',
-                    title="Rating Distribution by Category",
-                    labels={'Viewer_Rate': 'Rating'}
-                )
-                fig_box.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_box, use_container_width=True)
+                def build_rating_box():
+                    if len(df) > PLOT_SAMPLE_ROWS:
+                        # Too many films to ship every rating to the browser: send each category's
+                        # precomputed box instead, so the payload no longer grows with the upload
+                        fig_box = go.Figure([
+                            go.Box(
+                                name=str(category), q1=[row['q1']], median=[row['median']], q3=[row['q3']],
+                                lowerfence=[row['lowerfence']], upperfence=[row['upperfence']]
+                            )
+                            for category, row in aggregates['rating_boxes'].iterrows()
+                        ])
+                        fig_box.update_layout(
+                            title="Rating Distribution by Category",
+                            xaxis_title='Category',
+                            yaxis_title='Rating',
+                            legend_title_text='Category'
+                        )
+                    else:
+                        fig_box = px.box(
+                            df,
+                            x='Category',
+                            y='Viewer_Rate',
+                            color='Category',
+                            title="Rating Distribution by Category",
+                            labels={'Viewer_Rate': 'Rating'}
+                        )
+                    fig_box.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_box
+                st.plotly_chart(cached_figure(data_key, 'rating_box', build_rating_box), use_container_width=True)
             
             # Engagement score analysis
             if 'Engagement_Score' in df.columns:
                 st.subheader("💎 Engagement Score Analysis")
                 
-                engagement_by_cat = df.groupby('Category')['Engagement_Score'].mean().sort_values(ascending=False)
+                engagement_by_cat = aggregates['category_engagement'].sort_values(ascending=False)
                 
-                fig_engage = px.bar(
-                    x=engagement_by_cat.index,
-                    y=engagement_by_cat.values,
-                    title="Average Engagement Score by Category",
-                    labels={'x': 'Category', 'y': 'Avg Engagement Score'},
-                    color=engagement_by_cat.values,
-                    color_continuous_scale='turbo'
-                )
-                fig_engage.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_engage, use_container_width=True)
+                def build_category_engagement_bar():
+                    fig_engage = _bar(
+                        engagement_by_cat, "Average Engagement Score by Category", 'Avg Engagement Score', 'Category', 'turbo'
+                    )
+                    fig_engage.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_engage
+                st.plotly_chart(cached_figure(data_key, 'category_engagement_bar', build_category_engagement_bar), use_container_width=True)
         
         # TAB 4: CATEGORY & LANGUAGE INSIGHTS
         with tab4:
@@ -977,22 +1587,22 @@ if uploaded_file is not None:
             # Interactive filters
             col1, col2 = st.columns(2)
             with col1:
+                category_options = aggregates['category_options']
                 selected_categories = st.multiselect(
                     "Select Categories",
-                    options=df['Category'].unique(),
-                    default=df['Category'].unique()[:3]
+                    options=category_options,
+                    default=category_options[:3]
                 )
             with col2:
+                language_options = aggregates['language_options']
                 selected_languages = st.multiselect(
                     "Select Languages",
-                    options=df['Language'].unique(),
-                    default=df['Language'].unique()[:5]
+                    options=language_options,
+                    default=language_options[:5]
                 )
             
-            filtered_df = df[
-                (df['Category'].isin(selected_categories)) & 
-                (df['Language'].isin(selected_languages))
-            ]
+            selection_key = (tuple(sorted(selected_categories)), tuple(sorted(selected_languages)))
+            selection = compute_selection(data_key, *selection_key, df)
             
             st.markdown(f"""
                 <div style='background-color: rgba(79, 172, 254, 0.2); 
@@ -1002,7 +1612,7 @@ if uploaded_file is not None:
                             margin-top: 10px;
                             margin-bottom: 20px;'>
                     <p style='color: white !important; margin: 0; font-size: 1rem;'>
-                        <span style='color: white !important;'>Showing data for {len(filtered_df)} films</span>
+                        <span style='color: white !important;'>Showing data for {selection['film_count']} films</span>
                     </p>
                 </div>
             """, unsafe_allow_html=True)
@@ -1010,47 +1620,50 @@ if uploaded_file is not None:
             # Category-Language cross analysis
             st.subheader("🔄 Category-Language Cross Analysis")
             
-            cross_tab = pd.crosstab(filtered_df['Category'], filtered_df['Language'], 
-                                   values=filtered_df['Number_of_Views'], aggfunc='sum')
+            cross_tab = selection['cross_tab']
             
-            fig_heatmap = px.imshow(
-                cross_tab,
-                title="Views Heatmap: Category vs Language",
-                labels=dict(x="Language", y="Category", color="Total Views"),
-                color_continuous_scale='YlOrRd',
-                aspect='auto'
-            )
-            fig_heatmap.update_layout(
-                title_font_size=20,
-                title_font_color='#667eea',
-                title_font_family='Poppins'
+            def build_crosstab_heatmap():
+                fig_heatmap = px.imshow(
+                    cross_tab,
+                    title="Views Heatmap: Category vs Language",
+                    labels=dict(x="Language", y="Category", color="Total Views"),
+                    color_continuous_scale='YlOrRd',
+                    aspect='auto'
+                )
+                fig_heatmap.update_layout(
+                    title_font_size=20,
+                    title_font_color='#667eea',
+                    title_font_family='Poppins'
+                )
+                return fig_heatmap
+            # Keyed by the selection as well, since the cross-tab follows the filters
+            st.plotly_chart(
+                cached_selection_figure(data_key, 'crosstab_heatmap', selection_key, build_crosstab_heatmap),
+                use_container_width=True
             )
-            st.plotly_chart(fig_heatmap, use_container_width=True)
             
             # Performance metrics by selection
             col1, col2 = st.columns(2)
             
             with col1:
-                category_performance = filtered_df.groupby('Category').agg({
-                    'Number_of_Views': 'sum',
-                    'Viewer_Rate': 'mean',
-                    'Film_Name': 'count'
-                }).round(2)
-                category_performance.columns = ['Total Views', 'Avg Rating', 'Film Count']
+                category_performance = selection['category_performance']
                 
                 st.subheader("📊 Category Performance")
-                st.dataframe(category_performance.style.background_gradient(cmap='Blues'), use_container_width=True)
+                st.dataframe(
+                    category_performance,
+                    column_config={'Total Views': _bar_column(category_performance['Total Views'], '%d')},
+                    use_container_width=True
+                )
             
             with col2:
-                language_performance = filtered_df.groupby('Language').agg({
-                    'Number_of_Views': 'sum',
-                    'Viewer_Rate': 'mean',
-                    'Film_Name': 'count'
-                }).round(2)
-                language_performance.columns = ['Total Views', 'Avg Rating', 'Film Count']
+                language_performance = selection['language_performance']
                 
                 st.subheader("📊 Language Performance")
-                st.dataframe(language_performance.style.background_gradient(cmap='Greens'), use_container_width=True)
+                st.dataframe(
+                    language_performance,
+                    column_config={'Total Views': _bar_column(language_performance['Total Views'], '%d')},
+                    use_container_width=True
+                )
         
         # TAB 5: PERFORMANCE ANALYSIS
         with tab5:
@@ -1061,109 +1674,122 @@ if uploaded_file is not None:
             
             with col1:
                 st.subheader("🏆 Top 10 Performing Films")
-                top_10 = df.nlargest(10, 'Number_of_Views')[
-                    ['Film_Name', 'Category', 'Viewer_Rate', 'Number_of_Views']
-                ]
+                top_10 = aggregates['top_views']
                 
-                fig_top10 = px.bar(
-                    top_10,
-                    x='Number_of_Views',
-                    y='Film_Name',
-                    orientation='h',
-                    color='Viewer_Rate',
-                    title="Top 10 Films by Views",
-                    color_continuous_scale='Greens'
-                )
-                fig_top10.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_top10, use_container_width=True)
+                def build_top_views_bar():
+                    fig_top10 = px.bar(
+                        top_10,
+                        x='Number_of_Views',
+                        y='Film_Name',
+                        orientation='h',
+                        color='Viewer_Rate',
+                        title="Top 10 Films by Views",
+                        color_continuous_scale='Greens'
+                    )
+                    fig_top10.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_top10
+                st.plotly_chart(cached_figure(data_key, 'top_views_bar', build_top_views_bar), use_container_width=True)
             
             with col2:
                 st.subheader("⭐ Highest Rated Films")
-                top_rated = df.nlargest(10, 'Viewer_Rate')[
-                    ['Film_Name', 'Category', 'Viewer_Rate', 'Number_of_Views']
-                ]
+                top_rated = aggregates['top_rated']
                 
-                fig_rated = px.bar(
-                    top_rated,
-                    x='Viewer_Rate',
-                    y='Film_Name',
-                    orientation='h',
-                    color='Number_of_Views',
-                    title="Top 10 Highest Rated Films",
-                    color_continuous_scale='Reds'
-                )
-                fig_rated.update_layout(
-                    title_font_size=20,
-                    title_font_color='#667eea',
-                    title_font_family='Poppins'
-                )
-                st.plotly_chart(fig_rated, use_container_width=True)
+                def build_top_rated_bar():
+                    fig_rated = px.bar(
+                        top_rated,
+                        x='Viewer_Rate',
+                        y='Film_Name',
+                        orientation='h',
+                        color='Number_of_Views',
+                        title="Top 10 Highest Rated Films",
+                        color_continuous_scale='Reds'
+                    )
+                    fig_rated.update_layout(
+                        title_font_size=20,
+                        title_font_color='#667eea',
+                        title_font_family='Poppins'
+                    )
+                    return fig_rated
+                st.plotly_chart(cached_figure(data_key, 'top_rated_bar', build_top_rated_bar), use_container_width=True)
             
             # Performance quadrant analysis
             st.subheader("📍 Performance Quadrant Analysis")
             
-            median_views = df['Number_of_Views'].median()
-            median_rating = df['Viewer_Rate'].median()
-            
-            df['Quadrant'] = 'Low Performance'
-            df.loc[(df['Number_of_Views'] >= median_views) & (df['Viewer_Rate'] >= median_rating), 'Quadrant'] = 'Star Performers'
-            df.loc[(df['Number_of_Views'] >= median_views) & (df['Viewer_Rate'] < median_rating), 'Quadrant'] = 'High Views, Low Rating'
-            df.loc[(df['Number_of_Views'] < median_views) & (df['Viewer_Rate'] >= median_rating), 'Quadrant'] = 'Hidden Gems'
+            # Quadrants are classified once per upload with the other aggregates
+            median_views = aggregates['median_views']
+            median_rating = aggregates['median_rating']
+            quadrant_df = aggregates['df_with_quadrant']
             
-            fig_quadrant = px.scatter(
-                df,
-                x='Number_of_Views',
-                y='Viewer_Rate',
-                color='Quadrant',
-                size='Number_of_Views',
-                hover_data=['Film_Name', 'Category'],
-                title="Film Performance Quadrants",
-                color_discrete_map={
-                    'Star Performers': 'green',
-                    'High Views, Low Rating': 'orange',
-                    'Hidden Gems': 'blue',
-                    'Low Performance': 'red'
-                }
-            )
-            
-            fig_quadrant.add_hline(y=median_rating, line_dash="dash", line_color="gray")
-            fig_quadrant.add_vline(x=median_views, line_dash="dash", line_color="gray")
-            fig_quadrant.update_layout(
-                title_font_size=20,
-                title_font_color='#667eea',
-                title_font_family='Poppins'
-            )
-            
-            st.plotly_chart(fig_quadrant, use_container_width=True)
-            
-            # Quadrant counts
-            quadrant_counts = df['Quadrant'].value_counts()
-            col1, col2, col3, col4 = st.columns(4)
+            def build_performance_quadrants():
+                if len(quadrant_df) > PLOT_SAMPLE_ROWS:
+                    # Too many films for one marker each: plot the density and label the quadrants
+                    counts, view_edges, rating_edges = np.histogram2d(
+                        quadrant_df['Number_of_Views'].to_numpy(), quadrant_df['Viewer_Rate'].to_numpy(), bins=[60, 40]
+                    )
+                    fig_quadrant = go.Figure(go.Heatmap(
+                        x=(view_edges[:-1] + view_edges[1:]) / 2,
+                        y=(rating_edges[:-1] + rating_edges[1:]) / 2,
+                        z=counts.T,
+                        colorscale='Viridis',
+                        colorbar=dict(title='Films')
+                    ))
+                    fig_quadrant.update_layout(
+                        title="Film Performance Quadrants",
+                        xaxis_title='Number_of_Views',
+                        yaxis_title='Viewer_Rate'
+                    )
+                    for quadrant, x, y in (
+                        ('Star Performers', 0.98, 0.98),
+                        ('High Views, Low Rating', 0.98, 0.02),
+                        ('Hidden Gems', 0.02, 0.98),
+                        ('Low Performance', 0.02, 0.02)
+                    ):
+                        fig_quadrant.add_annotation(
+                            text=quadrant, xref='paper', yref='paper', x=x, y=y,
+                            xanchor='right' if x > 0.5 else 'left', yanchor='top' if y > 0.5 else 'bottom',
+                            showarrow=False, font=dict(color=QUADRANT_COLORS[quadrant], size=14)
+                        )
+                else:
+                    fig_quadrant = px.scatter(
+                        quadrant_df,
+                        x='Number_of_Views',
+                        y='Viewer_Rate',
+                        color='Quadrant',
+                        size='Number_of_Views',
+                        hover_data=['Film_Name', 'Category'],
+                        title="Film Performance Quadrants",
+                        color_discrete_map=QUADRANT_COLORS
+                    )
             
-            for idx, (quadrant, count) in enumerate(quadrant_counts.items()):
-                with [col1, col2, col3, col4][idx]:
-                    st.metric(quadrant, count)
+                fig_quadrant.add_hline(y=median_rating, line_dash="dash", line_color="gray")
+                fig_quadrant.add_vline(x=median_views, line_dash="dash", line_color="gray")
+                fig_quadrant.update_layout(
+                    title_font_size=20,
+                    title_font_color='#667eea',
+                    title_font_family='Poppins'
+                )
+                return fig_quadrant
+            st.plotly_chart(cached_figure(data_key, 'performance_quadrants', build_performance_quadrants), use_container_width=True)
+            
+            # Quadrant counts, shown in the fixed QUADRANT_COLORS order so each quadrant
+            # keeps its position (empty ones show 0)
+            quadrant_counts = aggregates['quadrant_counts']
+            for column, quadrant in zip(st.columns(4), QUADRANT_COLORS):
+                with column:
+                    st.metric(quadrant, int(quadrant_counts[quadrant]))
         
         # TAB 6: RECOMMENDATIONS
         with tab6:
             st.header("💡 Strategic Recommendations for December 2025")
             
-            # Generate insights
-            december_df = df[df['Viewing_Month_Name'] == 'December'] if 'Viewing_Month_Name' in df.columns else df
-            
-            top_december_category = december_df.groupby('Category')['Number_of_Views'].sum().idxmax()
-            top_december_language = december_df.groupby('Language')['Number_of_Views'].sum().idxmax()
-            avg_december_rating = december_df['Viewer_Rate'].mean()
-            
-            # Best performing time insights
-            if 'Viewing_Month_Name' in df.columns:
-                monthly_performance = df.groupby('Viewing_Month_Name')['Number_of_Views'].sum()
-                best_month = monthly_performance.idxmax()
-                december_rank = monthly_performance.rank(ascending=False)['December'] if 'December' in monthly_performance.index else 'N/A'
+            # Generate insights from the December summaries already computed for Tab 2
+            top_december_category = aggregates['december_category']['Number_of_Views'].idxmax()
+            top_december_language = aggregates['december_language_views'].idxmax()
+            avg_december_rating = aggregates['december_totals']['Viewer_Rate']
             
             st.markdown("### 🎯 Key Marketing Recommendations")
             
@@ -1211,45 +1837,38 @@ if uploaded_file is not None:
             # Content mix recommendation
             st.markdown("### 📊 Recommended Content Mix for December 2025")
             
-            category_mix = december_df.groupby('Category')['Number_of_Views'].sum()
+            category_mix = aggregates['december_category']['Number_of_Views']
             category_mix_pct = (category_mix / category_mix.sum() * 100).round(1)
             
-            fig_mix = px.pie(
-                values=category_mix_pct.values,
-                names=category_mix_pct.index,
-                title="Recommended Category Distribution for December Marketing",
-                hole=0.4
-            )
-            fig_mix.update_traces(textposition='outside', textinfo='percent+label')
-            fig_mix.update_layout(
-                title_font_size=20,
-                title_font_color='#667eea',
-                title_font_family='Poppins'
-            )
-            st.plotly_chart(fig_mix, use_container_width=True)
+            def build_december_mix_pie():
+                fig_mix = px.pie(
+                    values=category_mix_pct.values,
+                    names=category_mix_pct.index,
+                    title="Recommended Category Distribution for December Marketing",
+                    hole=0.4
+                )
+                fig_mix.update_traces(textposition='outside', textinfo='percent+label')
+                fig_mix.update_layout(
+                    title_font_size=20,
+                    title_font_color='#667eea',
+                    title_font_family='Poppins'
+                )
+                return fig_mix
+            st.plotly_chart(cached_figure(data_key, 'december_mix_pie', build_december_mix_pie), use_container_width=True)
             
             # Marketing calendar
             st.markdown("### 📅 December 2025 Marketing Calendar")
             
-            calendar_data = {
-                'Week': ['Week 1 (Dec 1-7)', 'Week 2 (Dec 8-14)', 'Week 3 (Dec 15-21)', 'Week 4 (Dec 22-31)'],
-                'Focus': [
-                    f'Launch {top_december_category} campaign',
-                    'Mid-month engagement push',
-                    'Holiday season special promotions',
-                    'Year-end celebration content'
-                ],
-                'Content Type': [
-                    'New releases announcement',
-                    'User-generated content campaign',
-                    'Gift subscription promotions',
-                    'New Year preview teasers'
-                ],
-                'Budget Allocation': ['30%', '25%', '25%', '20%']
-            }
-            
-            calendar_df = pd.DataFrame(calendar_data)
-            st.dataframe(calendar_df, use_container_width=True, hide_index=True)
+            calendar_rows = [
+                {
+                    'Week': week,
+                    'Focus': focus.format(category=top_december_category),
+                    'Content Type': content_type,
+                    'Budget Allocation': budget
+                }
+                for week, focus, content_type, budget in CALENDAR_WEEKS
+            ]
+            st.dataframe(calendar_rows, use_container_width=True, hide_index=True)
             
             # Final success metrics
             st.markdown("### 🎯 Success Metrics to Track")
@@ -1321,30 +1940,42 @@ if uploaded_file is not None:
         
         # Data export option
         st.markdown("---")
-        st.subheader("📥 Export Data")
+        # Collapsed by default; the buttons' callables only serialize on click either way
+        with st.expander("📥 Export Data", expanded=False):
+            # The processed frame plus the per-upload Quadrant classification
+            export_df = aggregates['df_with_quadrant']
+            col1, col2, col3 = st.columns(3)
         
-        col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(
+                    label="Download Processed Data as CSV (gzip)",
+                    data=lambda: to_csv_gz_bytes(data_key, export_df),
+                    file_name="imovie_processed_data.csv.gz",
+                    mime="application/gzip"
+                )
         
-        with col1:
-            csv = df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="Download Processed Data as CSV",
-                data=csv,
-                file_name="imovie_processed_data.csv",
-                mime="text/csv"
-            )
+            with col2:
+                st.download_button(
+                    label="Download Processed Data as Excel",
+                    data=lambda: to_xlsx_bytes(data_key, export_df),
+                    file_name="imovie_processed_data.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
         
-        with col2:
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Processed Data', index=False)
-            
-            st.download_button(
-                label="Download Processed Data as Excel",
-                data=buffer.getvalue(),
-                file_name="imovie_processed_data.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+            # Binary columnar formats skip text encoding entirely and keep the column types
+            with col3:
+                st.download_button(
+                    label="Download Processed Data as Parquet",
+                    data=lambda: to_parquet_bytes(data_key, export_df),
+                    file_name="imovie_processed_data.parquet",
+                    mime="application/vnd.apache.parquet"
+                )
+                st.download_button(
+                    label="Download Processed Data as Feather",
+                    data=lambda: to_feather_bytes(data_key, export_df),
+                    file_name="imovie_processed_data.feather",
+                    mime="application/vnd.apache.arrow.file"
+                )
 
 else:
     # Welcome screen